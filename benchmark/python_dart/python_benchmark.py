@@ -3,25 +3,100 @@ NumPy/Pandas Performance Benchmark
 Comparison baseline for DartFrame benchmarks
 """
 
+import functools
+import math
+import os
+
+# Run every library single-threaded by default, like the DartFrame
+# benchmarks. These must be set before numpy (and numba) are imported and
+# start thread pools; values exported by the caller take precedence.
+THREAD_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+               'NUMBA_NUM_THREADS')
+for _var in THREAD_VARS:
+    os.environ.setdefault(_var, '1')
+
 import numpy as np
 import pandas as pd
 import time
-from typing import Callable, Any
+import timeit
+from typing import Callable, Any, Optional
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; its benchmarks are skipped without it
+    njit = None
+
+try:
+    import pyarrow  # noqa: F401
+    # Arrow-backed strings run .str methods as compiled Arrow kernels
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = object
+
+SEED = 42
+
+# ============ Fixtures ============
+# Input data is generated once per size so only the operation itself is timed.
+
+_rng = np.random.default_rng(SEED)
+
+ARRAY_100 = _rng.random((100, 100), dtype=np.float64)
+ARRAY_500_A = _rng.random((500, 500), dtype=np.float64)
+ARRAY_500_B = _rng.random((500, 500), dtype=np.float64)
+ARRAY_1000 = _rng.random((1000, 1000), dtype=np.float64)
+ARRAY_5000 = _rng.random((5000, 5000), dtype=np.float64)
+TABLE_100 = _rng.random((100, 10), dtype=np.float64)
+TABLE_1000 = _rng.random((1000, 2), dtype=np.float64)
+TABLE_10K = _rng.random((10000, 10), dtype=np.float64)
+TABLE_100K = _rng.random((100000, 10), dtype=np.float64)
+CATEGORY_CODES_10K = _rng.integers(0, 3, 10000, dtype=np.int8)
+WORDS_3000 = np.tile(np.array(['hello', 'world', 'python'], dtype='U6'), 1000)
+CATEGORY_CODES_3000 = np.tile(np.array([0, 1, 2], dtype=np.int8), 1000)
+
+# Shared by the column benchmarks, none of which modify it
+DF_10K = pd.DataFrame(TABLE_10K)
 
-def benchmark(func: Callable, name: str, iterations: int = 5) -> dict:
-    """Run benchmark and return timing results"""
-    times = []
-    result = None
+def pin_to_one_cpu():
+    """Pin the process to a single CPU so samples are not spread across cores
+
+    Call once at startup. Only done when every ``THREAD_VARS`` pool is
+    single-threaded, since pinning a multi-threaded pool to one core would
+    just time-slice it. This is a no-op on platforms without
+    ``os.sched_setaffinity`` (macOS, Windows).
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    if any(os.environ[var] != '1' for var in THREAD_VARS):
+        return
+    os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+
+def benchmark(func: Callable, name: str, iterations: int = 5,
+              setup: Optional[Callable[[], Any]] = None, warmup: int = 2) -> dict:
+    """Run benchmark and return timing results
+
+    If ``setup`` is given it is called once before timing and its result is
+    passed to ``func`` on every iteration. ``func`` is then run ``warmup``
+    times untimed so cold caches and first-touch page faults are not sampled.
+    Each of the ``iterations`` samples runs ``func`` the number of times
+    picked by ``timeit.Timer.autorange`` (at least 0.2 s per sample, as
+    ``%timeit`` does) and is reported in milliseconds per call.
+    """
+    args = () if setup is None else (setup(),)
+    for _ in range(warmup):
+        func(*args)
+    result = func(*args)
+    # partial calls func directly, without an extra Python frame per call
+    call = functools.partial(func, *args)
     
-    for _ in range(iterations):
-        start = time.perf_counter()
-        result = func()
-        end = time.perf_counter()
-        times.append((end - start) * 1000)  # Convert to milliseconds
+    # autorange compares against seconds, so calibrate with the default
+    # clock and take the samples themselves in integer nanoseconds
+    number, _ = timeit.Timer(call).autorange()
+    timer = timeit.Timer(call, timer=time.perf_counter_ns)
+    times = [t / number for t in timer.repeat(repeat=iterations, number=number)]
     
-    avg_time = sum(times) / len(times)
-    min_time = min(times)
-    max_time = max(times)
+    avg_time = sum(times) / len(times) / 1e6  # Convert to milliseconds
+    min_time = min(times) / 1e6
+    max_time = max(times) / 1e6
     
     return {
         'name': name,
@@ -33,129 +108,195 @@ def benchmark(func: Callable, name: str, iterations: int = 5) -> dict:
 
 def print_result(result: dict):
     """Print benchmark result"""
-    print(f"{result['name']:50} | Avg: {result['avg_ms']:8.2f}ms | Min: {result['min_ms']:8.2f}ms | Max: {result['max_ms']:8.2f}ms")
+    print(f"{result['name']:50} | Avg: {result['avg_ms']:12.4f}ms | Min: {result['min_ms']:12.4f}ms | Max: {result['max_ms']:12.4f}ms")
 
 # ============ NumPy Benchmarks ============
 
-def numpy_array_creation_small():
-    """Create small array (100x100)"""
-    return np.zeros((100, 100))
+def numpy_empty_creation_small():
+    """Allocate uninitialized small array (100x100)"""
+    return np.empty((100, 100), dtype=np.float64)
+
+def numpy_empty_creation_medium():
+    """Allocate uninitialized medium array (1000x1000)"""
+    return np.empty((1000, 1000), dtype=np.float64)
 
-def numpy_array_creation_medium():
-    """Create medium array (1000x1000)"""
-    return np.zeros((1000, 1000))
+def numpy_empty_creation_large():
+    """Allocate uninitialized large array (5000x5000)"""
+    return np.empty((5000, 5000), dtype=np.float64)
 
-def numpy_array_creation_large():
-    """Create large array (5000x5000)"""
-    return np.zeros((5000, 5000))
+def numpy_zeros_creation_small():
+    """Create zero-filled small array (100x100)"""
+    return np.zeros((100, 100), dtype=np.float64)
 
-def numpy_array_sum_small():
+def numpy_zeros_creation_medium():
+    """Create zero-filled medium array (1000x1000)"""
+    return np.zeros((1000, 1000), dtype=np.float64)
+
+def numpy_zeros_creation_large():
+    """Create zero-filled large array (5000x5000)"""
+    return np.zeros((5000, 5000), dtype=np.float64)
+
+def numpy_array_sum_small(arr):
     """Sum small array"""
-    arr = np.random.rand(100, 100)
     return np.sum(arr)
 
-def numpy_array_sum_medium():
+def numpy_array_sum_medium(arr):
     """Sum medium array"""
-    arr = np.random.rand(1000, 1000)
     return np.sum(arr)
 
-def numpy_array_sum_large():
+def numpy_array_sum_large(arr):
     """Sum large array"""
-    arr = np.random.rand(5000, 5000)
     return np.sum(arr)
 
-def numpy_array_mean():
+def numpy_array_mean(arr):
     """Calculate mean"""
-    arr = np.random.rand(1000, 1000)
     return np.mean(arr)
 
-def numpy_array_std():
+def numpy_array_std(arr):
     """Calculate standard deviation"""
-    arr = np.random.rand(1000, 1000)
     return np.std(arr)
 
-def numpy_matrix_multiply():
-    """Matrix multiplication"""
-    a = np.random.rand(500, 500)
-    b = np.random.rand(500, 500)
-    return np.dot(a, b)
+def numpy_matrix_multiply(operands):
+    """Matrix multiplication into a preallocated output"""
+    a, b, out = operands
+    return np.dot(a, b, out=out)
 
-def numpy_slicing():
+def numpy_slicing(arr):
     """Array slicing"""
-    arr = np.random.rand(1000, 1000)
     return arr[100:200, 200:300]
 
+def numpy_string_upper(words):
+    """Uppercase a fixed-width unicode array"""
+    return np.char.upper(words)
+
+def numpy_category_counts(codes):
+    """Count category codes with a single bincount pass"""
+    counts = np.bincount(codes, minlength=3)
+    return pd.Series(counts, index=['A', 'B', 'C'])
+
+def numpy_rolling_mean_cumsum(x, w=100):
+    """Rolling mean from the difference of a running sum"""
+    c = np.empty(x.size + 1, dtype=np.float64)
+    c[0] = 0.0
+    np.cumsum(x, out=c[1:])
+    out = np.full(x.size, np.nan)
+    out[w - 1:] = (c[w:] - c[:-w]) / w
+    return out
+
 # ============ Pandas Benchmarks ============
 
-def pandas_dataframe_creation_small():
+def pandas_dataframe_creation_small(arr):
     """Create small DataFrame (100x10)"""
-    return pd.DataFrame(np.random.rand(100, 10))
+    return pd.DataFrame(arr)
 
-def pandas_dataframe_creation_medium():
+def pandas_dataframe_creation_medium(arr):
     """Create medium DataFrame (10000x10)"""
-    return pd.DataFrame(np.random.rand(10000, 10))
+    return pd.DataFrame(arr)
 
-def pandas_dataframe_creation_large():
+def pandas_dataframe_creation_large(arr):
     """Create large DataFrame (100000x10)"""
-    return pd.DataFrame(np.random.rand(100000, 10))
+    return pd.DataFrame(arr)
 
-def pandas_column_sum():
+def pandas_column_sum(df):
     """Sum DataFrame column"""
-    df = pd.DataFrame(np.random.rand(10000, 10))
     return df[0].sum()
 
-def pandas_column_mean():
+def pandas_column_mean(df):
     """Mean of DataFrame column"""
-    df = pd.DataFrame(np.random.rand(10000, 10))
     return df[0].mean()
 
-def pandas_column_std():
+def pandas_column_std(df):
     """Std of DataFrame column"""
-    df = pd.DataFrame(np.random.rand(10000, 10))
     return df[0].std()
 
-def pandas_groupby():
+def pandas_groupby(df):
     """GroupBy operation"""
-    df = pd.DataFrame({
-        'category': np.random.choice(['A', 'B', 'C'], 10000),
-        'value': np.random.rand(10000)
-    })
-    return df.groupby('category')['value'].sum()
+    return df.groupby('category', observed=True)['value'].sum()
 
-def pandas_filtering():
+def pandas_filtering(df):
     """Filter DataFrame"""
-    df = pd.DataFrame(np.random.rand(10000, 10))
-    return df[df[0] > 0.5]
+    idx = np.flatnonzero(df[0].to_numpy() > 0.5)
+    return df.take(idx)
 
-def pandas_sorting():
+def pandas_sorting(df):
     """Sort DataFrame"""
-    df = pd.DataFrame(np.random.rand(10000, 10))
     return df.sort_values(by=0)
 
-def pandas_merge():
-    """Merge DataFrames"""
-    df1 = pd.DataFrame({'key': range(1000), 'value1': np.random.rand(1000)})
-    df2 = pd.DataFrame({'key': range(1000), 'value2': np.random.rand(1000)})
-    return pd.merge(df1, df2, on='key')
+def pandas_merge(frames):
+    """Merge DataFrames on their sorted unique key index"""
+    df1, df2 = frames
+    return df1.join(df2, how='inner')
 
-def pandas_rolling_window():
+def pandas_rolling_window(series):
     """Rolling window operation"""
-    df = pd.DataFrame({'value': np.random.rand(10000)})
-    return df['value'].rolling(window=100).mean()
+    return series.rolling(window=100).mean()
 
-def pandas_string_operations():
+def pandas_string_operations(s):
     """String operations"""
-    s = pd.Series(['hello', 'world', 'python'] * 1000)
     return s.str.upper()
 
-def pandas_categorical():
+def pandas_categorical(codes):
     """Categorical operations"""
-    s = pd.Series(pd.Categorical(['A', 'B', 'C'] * 1000))
+    s = pd.Series(pd.Categorical.from_codes(codes, categories=['A', 'B', 'C']))
     return s.value_counts()
 
+# ============ Numba Benchmarks ============
+# Small reductions spend most of their time in ufunc dispatch rather than in
+# the kernel; these compiled loops show the cost of the arithmetic alone.
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _sum(a):
+        flat = a.ravel()
+        s = 0.0
+        for i in range(flat.size):
+            s += flat[i]
+        return s
+
+    @njit(fastmath=True, cache=True)
+    def _mean_std(a):
+        flat = a.ravel()
+        n = flat.size
+        s = 0.0
+        s2 = 0.0
+        for i in range(n):
+            v = flat[i]
+            s += v
+            s2 += v * v
+        m = s / n
+        # E[x^2] - E[x]^2 can cancel to a small negative value
+        return m, math.sqrt(max(s2 / n - m * m, 0.0))
+
+def numba_array_sum(arr):
+    """Sum array with a compiled loop"""
+    return _sum(arr)
+
+def numba_column_sum(values):
+    """Sum DataFrame column values with a compiled loop"""
+    return _sum(values)
+
+def numba_array_mean_std(arr):
+    """Mean and standard deviation in a single pass over the array"""
+    return _mean_std(arr)
+
+# ============ Fixture Setup ============
+
+def _groupby_frame():
+    return pd.DataFrame({
+        'category': pd.Categorical.from_codes(CATEGORY_CODES_10K, categories=['A', 'B', 'C']),
+        'value': TABLE_10K[:, 0]
+    })
+
+def _merge_frames():
+    df1 = pd.DataFrame({'key': range(1000), 'value1': TABLE_1000[:, 0]})
+    df2 = pd.DataFrame({'key': range(1000), 'value2': TABLE_1000[:, 1]})
+    return df1.set_index('key'), df2.set_index('key')
+
 # ============ Main Benchmark Runner ============
 
 def main():
+    pin_to_one_cpu()
+    
     print("=" * 100)
     print("NumPy/Pandas Performance Benchmark")
     print("=" * 100)
@@ -166,20 +307,26 @@ def main():
     print("-" * 100)
     
     benchmarks = [
-        (numpy_array_creation_small, "Array Creation (100x100)"),
-        (numpy_array_creation_medium, "Array Creation (1000x1000)"),
-        (numpy_array_creation_large, "Array Creation (5000x5000)"),
-        (numpy_array_sum_small, "Array Sum (100x100)"),
-        (numpy_array_sum_medium, "Array Sum (1000x1000)"),
-        (numpy_array_sum_large, "Array Sum (5000x5000)"),
-        (numpy_array_mean, "Array Mean (1000x1000)"),
-        (numpy_array_std, "Array Std (1000x1000)"),
-        (numpy_matrix_multiply, "Matrix Multiply (500x500)"),
-        (numpy_slicing, "Array Slicing (1000x1000)"),
+        (numpy_empty_creation_small, "Array Creation empty (100x100)", None),
+        (numpy_empty_creation_medium, "Array Creation empty (1000x1000)", None),
+        (numpy_empty_creation_large, "Array Creation empty (5000x5000)", None),
+        (numpy_zeros_creation_small, "Array Creation zeros (100x100)", None),
+        (numpy_zeros_creation_medium, "Array Creation zeros (1000x1000)", None),
+        (numpy_zeros_creation_large, "Array Creation zeros (5000x5000)", None),
+        (numpy_array_sum_small, "Array Sum (100x100)", lambda: ARRAY_100),
+        (numpy_array_sum_medium, "Array Sum (1000x1000)", lambda: ARRAY_1000),
+        (numpy_array_sum_large, "Array Sum (5000x5000)", lambda: ARRAY_5000),
+        (numpy_array_mean, "Array Mean (1000x1000)", lambda: ARRAY_1000),
+        (numpy_array_std, "Array Std (1000x1000)", lambda: ARRAY_1000),
+        (numpy_matrix_multiply, "Matrix Multiply (500x500)", lambda: (ARRAY_500_A, ARRAY_500_B, np.empty((500, 500)))),
+        (numpy_slicing, "Array Slicing (1000x1000)", lambda: ARRAY_1000),
+        (numpy_rolling_mean_cumsum, "Rolling Mean cumsum (10000)", lambda: np.ascontiguousarray(TABLE_10K[:, 0])),
+        (numpy_string_upper, "String Upper (3000 items)", lambda: WORDS_3000),
+        (numpy_category_counts, "Category Counts bincount (3000 items)", lambda: CATEGORY_CODES_3000),
     ]
     
-    for func, name in benchmarks:
-        result = benchmark(func, name)
+    for func, name, setup in benchmarks:
+        result = benchmark(func, name, setup=setup)
         print_result(result)
     
     print()
@@ -187,25 +334,42 @@ def main():
     print("-" * 100)
     
     benchmarks = [
-        (pandas_dataframe_creation_small, "DataFrame Creation (100x10)"),
-        (pandas_dataframe_creation_medium, "DataFrame Creation (10000x10)"),
-        (pandas_dataframe_creation_large, "DataFrame Creation (100000x10)"),
-        (pandas_column_sum, "Column Sum (10000 rows)"),
-        (pandas_column_mean, "Column Mean (10000 rows)"),
-        (pandas_column_std, "Column Std (10000 rows)"),
-        (pandas_groupby, "GroupBy Sum (10000 rows)"),
-        (pandas_filtering, "Filtering (10000 rows)"),
-        (pandas_sorting, "Sorting (10000 rows)"),
-        (pandas_merge, "Merge (1000 rows each)"),
-        (pandas_rolling_window, "Rolling Window (10000 rows)"),
-        (pandas_string_operations, "String Operations (3000 items)"),
-        (pandas_categorical, "Categorical Operations (3000 items)"),
+        (pandas_dataframe_creation_small, "DataFrame Creation (100x10)", lambda: TABLE_100),
+        (pandas_dataframe_creation_medium, "DataFrame Creation (10000x10)", lambda: TABLE_10K),
+        (pandas_dataframe_creation_large, "DataFrame Creation (100000x10)", lambda: TABLE_100K),
+        (pandas_column_sum, "Column Sum (10000 rows)", lambda: DF_10K),
+        (pandas_column_mean, "Column Mean (10000 rows)", lambda: DF_10K),
+        (pandas_column_std, "Column Std (10000 rows)", lambda: DF_10K),
+        (pandas_groupby, "GroupBy Sum (10000 rows)", _groupby_frame),
+        (pandas_filtering, "Filtering (10000 rows)", lambda: DF_10K),
+        (pandas_sorting, "Sorting (10000 rows)", lambda: DF_10K),
+        (pandas_merge, "Merge (1000 rows each)", _merge_frames),
+        (pandas_rolling_window, "Rolling Window (10000 rows)", lambda: pd.Series(TABLE_10K[:, 0])),
+        (pandas_string_operations, "String Operations (3000 items)", lambda: pd.Series(WORDS_3000, dtype=STRING_DTYPE)),
+        (pandas_categorical, "Categorical Operations (3000 items)", lambda: CATEGORY_CODES_3000),
     ]
     
-    for func, name in benchmarks:
-        result = benchmark(func, name)
+    for func, name, setup in benchmarks:
+        result = benchmark(func, name, setup=setup)
         print_result(result)
     
+    print()
+    print("Numba Compiled Kernels:")
+    print("-" * 100)
+    
+    if njit is None:
+        print("Skipped (numba not installed)")
+    else:
+        benchmarks = [
+            (numba_array_sum, "Array Sum (100x100)", lambda: ARRAY_100),
+            (numba_column_sum, "Column Sum (10000 rows)", lambda: np.ascontiguousarray(DF_10K[0].to_numpy())),
+            (numba_array_mean_std, "Array Mean+Std sum of squares (1000x1000)", lambda: ARRAY_1000),
+        ]
+        
+        for func, name, setup in benchmarks:
+            result = benchmark(func, name, setup=setup)
+            print_result(result)
+    
     print()
     print("=" * 100)
     print("Benchmark Complete!")
@@ -1,19 +1,83 @@
 """Simple NumPy/Pandas Performance Benchmark"""
 
+import os
+
+# Threading and CPU pinning follow python_benchmark.py
+THREAD_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+               'NUMBA_NUM_THREADS')
+for _var in THREAD_VARS:
+    os.environ.setdefault(_var, '1')
+
 import numpy as np
 import pandas as pd
 import time
+import timeit
 
-def benchmark(func, name, iterations=5):
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
+def benchmark(func, name, iterations=5, warmup=2):
+    for _ in range(warmup):
         func()
-        end = time.perf_counter()
-        times.append((end - start) * 1000)
+    # autorange works in seconds; the samples are taken in nanoseconds
+    number, _ = timeit.Timer(func).autorange()
+    timer = timeit.Timer(func, timer=time.perf_counter_ns)
+    times = timer.repeat(repeat=iterations, number=number)
     
-    avg_time = sum(times) / len(times)
-    return f"{name:50} | {avg_time:10.2f}ms"
+    avg_time = sum(times) / len(times) / number / 1e6
+    return f"{name:50} | {avg_time:12.4f}ms"
+
+# Input data is generated once so only the operation itself is timed
+
+_rng = np.random.default_rng(42)
+
+ARRAY_100 = _rng.random((100, 100))
+ARRAY_1000 = _rng.random((1000, 1000))
+TABLE_100 = _rng.random((100, 10))
+TABLE_10K = _rng.random((10000, 10))
+VALUES_1000 = _rng.random(1000)
+DF_1000 = pd.DataFrame(_rng.random((1000, 10)))
+DF_10K = pd.DataFrame(TABLE_10K)
+DICT_FRAME_1000 = pd.DataFrame({'col1': range(1000), 'col2': VALUES_1000})
+
+# Benchmarked operations. Module globals are bound as default arguments so
+# the timed calls use fast local lookups instead of global dict lookups.
+
+def zeros100(_z=np.zeros, _n=100):
+    return _z((_n, _n))
+
+def zeros1000(_z=np.zeros, _n=1000):
+    return _z((_n, _n))
+
+def sum100(_s=np.sum, _a=ARRAY_100):
+    return _s(_a)
+
+def sum1000(_s=np.sum, _a=ARRAY_1000):
+    return _s(_a)
+
+def frame100(_df=pd.DataFrame, _a=TABLE_100):
+    return _df(_a)
+
+def frame10000(_df=pd.DataFrame, _a=TABLE_10K):
+    return _df(_a)
+
+def column_access(_d=DF_10K):
+    return _d[0]
+
+def value_access(_d=DF_10K):
+    return _d.iloc[0, 0]
+
+def head(_d=DF_1000):
+    return _d.head()
+
+def describe(_d=DF_1000):
+    return _d.describe()
+
+def from_dict(_df=pd.DataFrame, _v=VALUES_1000):
+    return _df({'col1': range(1000), 'col2': _v})
+
+def to_dict(_d=DICT_FRAME_1000):
+    return _d.to_dict()
+
+if hasattr(os, 'sched_setaffinity') and all(os.environ[v] == '1' for v in THREAD_VARS):
+    os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
 
 print("=" * 80)
 print("NumPy/Pandas Performance Benchmark")
@@ -24,23 +88,23 @@ print()
 print("NumPy Array Operations:")
 print("-" * 80)
 
-print(benchmark(lambda: np.zeros((100, 100)), "Array Creation (100x100)"))
-print(benchmark(lambda: np.zeros((1000, 1000)), "Array Creation (1000x1000)"))
-print(benchmark(lambda: np.sum(np.random.rand(100, 100)), "Array Sum (100x100)"))
-print(benchmark(lambda: np.sum(np.random.rand(1000, 1000)), "Array Sum (1000x1000)"))
+print(benchmark(zeros100, "Array Creation (100x100)"))
+print(benchmark(zeros1000, "Array Creation (1000x1000)"))
+print(benchmark(sum100, "Array Sum (100x100)"))
+print(benchmark(sum1000, "Array Sum (1000x1000)"))
 
 print()
 print("Pandas DataFrame Operations:")
 print("-" * 80)
 
-print(benchmark(lambda: pd.DataFrame(np.random.rand(100, 10)), "DataFrame Creation (100x10)"))
-print(benchmark(lambda: pd.DataFrame(np.random.rand(10000, 10)), "DataFrame Creation (10000x10)"))
-print(benchmark(lambda: pd.DataFrame(np.random.rand(10000, 10))[0], "Column Access (10000 rows)"))
-print(benchmark(lambda: pd.DataFrame(np.random.rand(10000, 10)).iloc[0, 0], "Value Access (10000 rows)"))
-print(benchmark(lambda: pd.DataFrame(np.random.rand(1000, 10)).head(), "Head Operation (1000 rows)"))
-print(benchmark(lambda: pd.DataFrame(np.random.rand(1000, 10)).describe(), "Describe Operation (1000 rows)"))
-print(benchmark(lambda: pd.DataFrame({'col1': range(1000), 'col2': np.random.rand(1000)}), "DataFrame.from_dict (1000 rows)"))
-print(benchmark(lambda: pd.DataFrame({'col1': range(1000), 'col2': np.random.rand(1000)}).to_dict(), "DataFrame.to_dict (1000 rows)"))
+print(benchmark(frame100, "DataFrame Creation (100x10)"))
+print(benchmark(frame10000, "DataFrame Creation (10000x10)"))
+print(benchmark(column_access, "Column Access (10000 rows)"))
+print(benchmark(value_access, "Value Access (10000 rows)"))
+print(benchmark(head, "Head Operation (1000 rows)"))
+print(benchmark(describe, "Describe Operation (1000 rows)"))
+print(benchmark(from_dict, "DataFrame.from_dict (1000 rows)"))
+print(benchmark(to_dict, "DataFrame.to_dict (1000 rows)"))
 
 print()
 print("=" * 80)
@@ -23,8 +23,8 @@ void main() async {
   // Example 1: Read 3D dataset
   print('--- Example 1: Reading 3D Dataset ---');
   final df3d = await FileReader.readHDF5(
-    'test_data/test_3d.h5',
-    dataset: '/volume',
+    'test_data/multidim_fixtures.h5',
+    dataset: '/3d/volume',
   );
 
   print('Shape information:');
@@ -45,8 +45,8 @@ void main() async {
   // Example 2: Read 4D dataset
   print('--- Example 2: Reading 4D Dataset ---');
   final df4d = await FileReader.readHDF5(
-    'test_data/test_4d.h5',
-    dataset: '/tensor',
+    'test_data/multidim_fixtures.h5',
+    dataset: '/4d/tensor',
   );
 
   final shape4dStr = df4d['_shape'][0] as String;
@@ -72,20 +72,20 @@ void main() async {
   print('--- Example 4: Mixed Dimensionality File ---');
 
   final dfVector = await FileReader.readHDF5(
-    'test_data/test_mixed_dims.h5',
-    dataset: '/vector',
+    'test_data/multidim_fixtures.h5',
+    dataset: '/mixed/vector',
   );
   print('1D vector: ${dfVector['data'].data.take(5).toList()}...');
 
   final dfMatrix = await FileReader.readHDF5(
-    'test_data/test_mixed_dims.h5',
-    dataset: '/matrix',
+    'test_data/multidim_fixtures.h5',
+    dataset: '/mixed/matrix',
   );
   print('2D matrix columns: ${dfMatrix.columns}');
 
   final dfCube = await FileReader.readHDF5(
-    'test_data/test_mixed_dims.h5',
-    dataset: '/cube',
+    'test_data/multidim_fixtures.h5',
+    dataset: '/mixed/cube',
   );
   final cubeShapeStr = dfCube['_shape'][0] as String;
   final cubeShape = cubeShapeStr.split('x').map(int.parse).toList();
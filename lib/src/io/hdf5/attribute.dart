@@ -51,13 +51,15 @@ class Hdf5Attribute {
 
     if (value is String) {
       final stringBytes = utf8.encode(value);
+      // Pure ASCII strings are flagged as ASCII so readers can skip UTF-8 decoding
+      final isAscii = stringBytes.length == value.length;
       datatype = Hdf5Datatype<String>(
         dataclass: Hdf5DatatypeClass.string,
         size: stringBytes.length + 1, // +1 for null terminator
         endian: endian,
         stringInfo: StringInfo(
           paddingType: StringPaddingType.nullTerminate,
-          characterSet: CharacterSet.utf8,
+          characterSet: isAscii ? CharacterSet.ascii : CharacterSet.utf8,
           isVariableLength: false,
         ),
       );
@@ -178,22 +178,23 @@ void main() async {
             units = dataset.attrs['units']
             description = dataset.attrs['description']
             
-            # h5py returns bytes for strings, decode them
-            if isinstance(units, bytes):
-                units = units.decode('utf-8')
-            if isinstance(description, bytes):
-                description = description.decode('utf-8')
+            # Dart writes ASCII strings as fixed-length ASCII, which h5py
+            # returns as bytes, so compare against bytes without decoding
+            if isinstance(units, str):
+                units = units.encode('ascii', 'replace')
+            if isinstance(description, str):
+                description = description.encode('ascii', 'replace')
             
-            if units != 'meters':
-                print(f"  ❌ Attribute 'units' mismatch: expected 'meters', got '{units}'")
+            if units != b'meters':
+                print(f"  ❌ Attribute 'units' mismatch: expected b'meters', got {units!r}")
                 return False
             
-            if description != 'Test data':
-                print(f"  ❌ Attribute 'description' mismatch: expected 'Test data', got '{description}'")
+            if description != b'Test data':
+                print(f"  ❌ Attribute 'description' mismatch: expected b'Test data', got {description!r}")
                 return False
             
-            print(f"  ✓ Attribute 'units': {units}")
-            print(f"  ✓ Attribute 'description': {description}")
+            print(f"  ✓ Attribute 'units': {units.decode('ascii')}")
+            print(f"  ✓ Attribute 'description': {description.decode('ascii')}")
             print(f"  ✅ Test passed!")
             return True
             
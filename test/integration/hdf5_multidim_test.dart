@@ -6,7 +6,7 @@ void main() {
     test('Read 3D dataset with shape information', () async {
       // This test requires a 3D HDF5 file
       // Create one with Python first if needed
-      final testFile = 'test_data/test_3d.h5';
+      final testFile = 'test_data/multidim_fixtures.h5';
 
       if (!FileIO().fileExistsSync(testFile)) {
         print('Skipping test - $testFile not found');
@@ -14,7 +14,7 @@ void main() {
         return;
       }
 
-      final df = await FileReader.readHDF5(testFile, dataset: '/volume');
+      final df = await FileReader.readHDF5(testFile, dataset: '/3d/volume');
 
       // Check shape information
       expect(df.columns.contains('_shape'), isTrue);
@@ -37,7 +37,7 @@ void main() {
     });
 
     test('Read 4D dataset with shape information', () async {
-      final testFile = 'test_data/test_4d.h5';
+      final testFile = 'test_data/multidim_fixtures.h5';
 
       if (!FileIO().fileExistsSync(testFile)) {
         print('Skipping test - $testFile not found');
@@ -45,7 +45,7 @@ void main() {
         return;
       }
 
-      final df = await FileReader.readHDF5(testFile, dataset: '/tensor');
+      final df = await FileReader.readHDF5(testFile, dataset: '/4d/tensor');
 
       // Check shape information
       expect(df['_shape'][0], equals('2x3x4x5'));
@@ -0,0 +1,22 @@
+import 'package:test/test.dart';
+import 'package:dartframe/src/io/hdf5/attribute.dart';
+import 'package:dartframe/src/io/hdf5/datatype.dart';
+
+void main() {
+  group('Hdf5Attribute.scalar', () {
+    test('flags pure ASCII strings with the ASCII character set', () {
+      final attr = Hdf5Attribute.scalar('units', 'meters');
+
+      expect(attr.datatype.dataclass, Hdf5DatatypeClass.string);
+      expect(attr.datatype.size, 7); // 6 chars + null terminator
+      expect(attr.datatype.stringInfo?.characterSet, CharacterSet.ascii);
+    });
+
+    test('keeps UTF-8 for strings with non-ASCII characters', () {
+      final attr = Hdf5Attribute.scalar('label', 'Größe');
+
+      expect(attr.datatype.size, 8); // 7 UTF-8 bytes + null terminator
+      expect(attr.datatype.stringInfo?.characterSet, CharacterSet.utf8);
+    });
+  });
+}